@@ -8,31 +8,122 @@ Features:
 5. Manual Text Input Panel
 """
 
+import time
+_IMPORT_START = time.perf_counter()
+
 import threading
 import subprocess
-import speech_recognition as sr
-from gtts import gTTS
-import sounddevice as sd
-import soundfile as sf
+import importlib
 import os
 import tempfile
-import customtkinter as ctk
-import ollama
-import pyautogui
-import pywhatkit
-import psutil
-import time
+import sqlite3
 import math
-import numpy as np
 from datetime import datetime
 import queue
 import json
 import re
 import webbrowser
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from contextlib import contextmanager
 import tkinter as tk
 from tkinter import scrolledtext
 import sys
+_STDLIB_IMPORT_TIME = time.perf_counter() - _IMPORT_START
+
+class StartupProfiler:
+    """Collects import and init timings for the startup report"""
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.entries = []
+        self.milestones = {}
+        self.lock = threading.Lock()
+
+    def record(self, category, name, seconds):
+        """Record a timed step (category is "import" or "init")"""
+        with self.lock:
+            self.entries.append((category, name, seconds, threading.current_thread().name))
+
+    @contextmanager
+    def phase(self, category, name):
+        """Time the enclosed block and record it"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, time.perf_counter() - start)
+
+    def mark(self, milestone):
+        """Record a milestone relative to process start (first call wins)"""
+        with self.lock:
+            self.milestones.setdefault(milestone, time.perf_counter() - self.start)
+
+    def report(self):
+        """Return a human readable breakdown of startup time"""
+        with self.lock:
+            entries = list(self.entries)
+            milestones = dict(self.milestones)
+
+        lines = ["=== STARTUP PROFILE ==="]
+        for category in ("import", "init"):
+            rows = [e for e in entries if e[0] == category]
+            if not rows:
+                continue
+            total = sum(e[2] for e in rows)
+            lines.append(f"{category.upper()} ({total * 1000:.1f} ms total)")
+            for _, name, seconds, thread in sorted(rows, key=lambda e: -e[2]):
+                lines.append(f"  {seconds * 1000:8.1f} ms  {name}  [{thread}]")
+
+        if milestones:
+            lines.append("MILESTONES (since process start)")
+            for name, seconds in sorted(milestones.items(), key=lambda m: m[1]):
+                lines.append(f"  {seconds * 1000:8.1f} ms  {name}")
+        return "\n".join(lines)
+
+STARTUP_PROFILER = StartupProfiler()
+STARTUP_PROFILER.start = _IMPORT_START
+STARTUP_PROFILER.record("import", "stdlib (incl. tkinter)", _STDLIB_IMPORT_TIME)
+
+# Eager imports, timed individually: the window needs customtkinter
+with STARTUP_PROFILER.phase("import", "customtkinter"):
+    import customtkinter as ctk
+with STARTUP_PROFILER.phase("import", "psutil"):
+    import psutil
+
+class LazyModule:
+    """Module proxy that defers the real import until first attribute access"""
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def load(self):
+        """Import the module now (thread-safe, only imports once)"""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    with STARTUP_PROFILER.phase("import", self._name):
+                        self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+# Heavy modules load on first use (pywhatkit in particular does network
+# work at import time), keeping them off the window's critical path.
+sr = LazyModule("speech_recognition")
+gtts = LazyModule("gtts")
+sd = LazyModule("sounddevice")
+sf = LazyModule("soundfile")
+ollama = LazyModule("ollama")
+pyautogui = LazyModule("pyautogui")
+pywhatkit = LazyModule("pywhatkit")
+pyperclip = LazyModule("pyperclip")
+np = LazyModule("numpy")
 
 # Advanced Configuration
 THEME_COLOR = "#00f2ff"
@@ -43,22 +134,364 @@ DARK_BG = "#050510"
 TEXT_COLOR = "#e0e0ff"
 INPUT_COLOR = "#222233"
 
+# System sampler: seconds between samples and number of samples kept
+SAMPLE_INTERVAL = 1.0
+SAMPLE_HISTORY = 300
+
+# Desktop actions: worker threads, max in-flight actions, window wait
+ACTION_WORKERS = 2
+ACTION_QUEUE_LIMIT = 8
+WINDOW_READY_TIMEOUT = 5.0
+WINDOW_FALLBACK_DELAY = 0.8
+CLIPBOARD_RESTORE_DELAY = 0.2
+TYPE_INTERVAL = 0.005
+
+# Conversation memory: prompt token budget, fill level after eviction,
+# budget for the summary of evicted turns, and how long Ollama keeps the
+# model (and its prompt cache) loaded between turns
+SYSTEM_PROMPT = "You are JARVIS. Be concise and helpful."
+CONTEXT_TOKEN_BUDGET = 1500
+CONTEXT_LOW_WATER = 0.6
+SUMMARY_TOKEN_BUDGET = 200
+OLLAMA_KEEP_ALIVE = "30m"
+
+# Long-term memory: database file, memories injected per prompt, and the
+# document frequency above which a term is too common to rank on
+MEMORY_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jarvis_memory.db")
+MEMORY_TOP_K = 3
+MEMORY_MAX_TERM_DF = 2000
+# Utterances auto-captured as facts: short declarative statements only
+FACT_PATTERN = (r"^(my name is|call me|i work (on|at|for|as)|i live in|i prefer|"
+                r"my (favourite|favorite) \w+ is|my (birthday|email|job|project|company) is)\s+\S")
+QUESTION_PATTERN = r"\?|^(what|who|where|when|why|how|which|is|are|do|does|can|could|should|would|will)\b"
+STOPWORDS = frozenset((
+    "the", "and", "but", "for", "with", "about", "from", "into", "over", "under", "that", "this",
+    "these", "those", "what", "which", "who", "whom", "whose", "when", "where", "why", "how",
+    "are", "was", "were", "been", "being", "have", "has", "had", "does", "did", "doing", "can",
+    "could", "should", "would", "will", "shall", "may", "might", "must", "you", "your", "yours",
+    "mine", "our", "ours", "they", "them", "their", "its", "his", "her", "hers", "him", "she",
+    "not", "any", "all", "some", "just", "also", "very", "too", "then", "than", "there", "here",
+    "tell", "please", "jarvis", "know", "get", "got", "let", "make", "out", "now",
+))
+
+def extract_fact(text):
+    """Return text if it is a declarative personal fact worth storing, else None"""
+    text = text.strip()
+    lowered = text.lower()
+    if re.search(QUESTION_PATTERN, lowered) or not re.match(FACT_PATTERN, lowered):
+        return None
+    return text.rstrip(".!")
+
+# External calls: time budget per command, per-call timeouts, hedging,
+# circuit breaker thresholds and fallbacks.
+# The command deadline covers everything up to the start of the spoken
+# reply: AI time to first token plus synthesis of the first speech chunk.
+# Once the reply streams, a stall longer than AI_STALL_TIMEOUT aborts it.
+COMMAND_DEADLINE = 60.0
+AI_FIRST_TOKEN_TIMEOUT = 20.0
+AI_TOTAL_TIMEOUT = 45.0  # whole reply; a longer one is cut off and kept as is
+AI_STALL_TIMEOUT = 30.0
+STREAM_DISPLAY_INTERVAL = 0.1  # seconds between partial reply redraws
+# Opt-in fallback, tried when the main model fails or gives no first
+# token. A second model on the same Ollama server competes for VRAM with
+# the main one (and can evict its prompt cache), so point AI_FALLBACK_HOST
+# at another machine when enabling this.
+AI_FALLBACK_MODEL = None
+AI_FALLBACK_HOST = None
+TTS_TIMEOUT = 6.0  # per chunk: gTTS makes one request per ~100 characters
+TTS_CHUNK_CHARS = 100
+SPEECH_CHARS_PER_SECOND = 12
+RECOGNIZER_TIMEOUT = 5.0
+YOUTUBE_TIMEOUT = 8.0
+BREAKER_FAILURES = 3
+BREAKER_RESET = 30.0
+
+AI_UNAVAILABLE_REPLY = "I'm having trouble accessing my neural network."
+AI_TIMEOUT_REPLY = "That is taking longer than it should. Please try again."
+AI_OFFLINE_REPLY = "My neural network is offline right now. Please try again shortly."
+
+class DeadlineExceeded(Exception):
+    """An external call ran past its timeout or the command's deadline"""
+
+class CircuitOpenError(Exception):
+    """Call rejected without trying because the backend's breaker is open"""
+
+class Deadline:
+    """Time budget shared by every external call made for one command"""
+    def __init__(self, seconds):
+        self.expires = time.monotonic() + seconds
+
+    def remaining(self):
+        return max(0.0, self.expires - time.monotonic())
+
+    def timeout(self, limit, reserve=0.0):
+        """Per-call timeout: the call's own limit capped by what is left,
+        keeping `reserve` seconds for the calls that follow"""
+        return max(0.0, min(limit, self.remaining() - reserve))
+
+class CircuitBreaker:
+    """Fails fast after repeated errors, letting one probe through after a cool-down"""
+    def __init__(self, name, failures=BREAKER_FAILURES, reset_after=BREAKER_RESET, on_change=None):
+        self.name = name
+        self.threshold = failures
+        self.reset_after = reset_after
+        self.on_change = on_change
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.lock = threading.Lock()
+
+    def _set(self, state):
+        if state != self.state:
+            self.state = state
+            if self.on_change:
+                self.on_change(self.name, state)
+
+    def available(self):
+        """Would a call be let through right now (without claiming the probe)"""
+        with self.lock:
+            if self.state == "open":
+                return time.monotonic() - self.opened_at >= self.reset_after
+            return not (self.state == "half_open" and self.probing)
+
+    def allow(self):
+        """Claim permission for one call"""
+        with self.lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.reset_after:
+                    return False
+                self._set("half_open")
+            if self.state == "half_open":
+                if self.probing:
+                    return False
+                self.probing = True
+            return True
+
+    def success(self):
+        with self.lock:
+            self.failures = 0
+            self.probing = False
+            self._set("closed")
+
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            self.probing = False
+            if self.state == "half_open" or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+                self._set("open")
+
+class ExternalCalls:
+    """Timeouts, circuit breakers and metrics for calls to external backends"""
+    STATE_ICONS = {"closed": "✅", "half_open": "🟡", "open": "⛔"}
+
+    def __init__(self, failures=BREAKER_FAILURES, reset_after=BREAKER_RESET):
+        self.lock = threading.Lock()
+        self.failures = failures
+        self.reset_after = reset_after
+        self.breakers = {}
+        self.counters = {}
+        self.on_change = None
+
+    def breaker(self, name):
+        with self.lock:
+            if name not in self.breakers:
+                self.breakers[name] = CircuitBreaker(name, self.failures, self.reset_after,
+                                                     on_change=self._state_changed)
+                self.counters[name] = {"calls": 0, "ok": 0, "failures": 0, "timeouts": 0,
+                                       "rejected": 0, "latencies": deque(maxlen=200)}
+            return self.breakers[name]
+
+    def _state_changed(self, name, state):
+        if self.on_change:
+            self.on_change(name, state)
+
+    def _count(self, name, key, latency=None):
+        with self.lock:
+            counters = self.counters[name]
+            counters[key] += 1
+            if latency is not None:
+                counters["latencies"].append(latency)
+
+    def call(self, name, func, *args, timeout, expected=(), **kwargs):
+        """Call func on a daemon thread, giving up after timeout seconds
+
+        Raises CircuitOpenError when the breaker is open and
+        DeadlineExceeded on timeout. Exceptions listed in `expected` are
+        normal outcomes (e.g. unintelligible speech) and do not count
+        against the breaker. A timed-out call is abandoned, not killed.
+        """
+        breaker = self.breaker(name)
+        if timeout <= 0:
+            self._count(name, "timeouts")
+            raise DeadlineExceeded(f"{name}: no time left in the command deadline")
+        if not breaker.allow():
+            self._count(name, "rejected")
+            raise CircuitOpenError(f"{name}: circuit open")
+
+        self._count(name, "calls")
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        start = time.perf_counter()
+        threading.Thread(target=run, name=f"external-{name}", daemon=True).start()
+        try:
+            result = future.result(timeout=timeout)
+        except FutureTimeout:
+            self._count(name, "timeouts")
+            breaker.failure()
+            raise DeadlineExceeded(f"{name}: timed out after {timeout:.1f}s") from None
+        except expected:
+            self._count(name, "ok", time.perf_counter() - start)
+            breaker.success()
+            raise
+        except Exception:
+            self._count(name, "failures")
+            breaker.failure()
+            raise
+        self._count(name, "ok", time.perf_counter() - start)
+        breaker.success()
+        return result
+
+    def stream(self, name, func, *args, first_timeout, total_timeout, on_chunk=None):
+        """Read the chunks of func(*args) on a daemon thread
+
+        Raises like call() when nothing arrives within first_timeout.
+        Once chunks arrive, a stream still running after total_timeout,
+        or failing partway, is cut off: its chunks so far are returned
+        with complete=False and it counts as a timeout or failure.
+        on_chunk is called on this thread as each chunk arrives.
+        Returns (chunks, complete).
+        """
+        breaker = self.breaker(name)
+        if min(first_timeout, total_timeout) <= 0:
+            self._count(name, "timeouts")
+            raise DeadlineExceeded(f"{name}: no time left in the command deadline")
+        if not breaker.allow():
+            self._count(name, "rejected")
+            raise CircuitOpenError(f"{name}: circuit open")
+
+        self._count(name, "calls")
+        items = queue.Queue()
+        stop = threading.Event()
+
+        def read():
+            try:
+                for chunk in func(*args):
+                    if stop.is_set():
+                        return
+                    items.put(("chunk", chunk))
+                items.put(("end", None))
+            except BaseException as e:
+                items.put(("error", e))
+
+        start = time.perf_counter()
+        first_expires = time.monotonic() + min(first_timeout, total_timeout)
+        expires = time.monotonic() + total_timeout
+        threading.Thread(target=read, name=f"external-{name}", daemon=True).start()
+        chunks = []
+        try:
+            while True:
+                limit = expires if chunks else first_expires
+                try:
+                    kind, value = items.get(timeout=max(0.0, limit - time.monotonic()))
+                except queue.Empty:
+                    self._count(name, "timeouts", time.perf_counter() - start if chunks else None)
+                    breaker.failure()
+                    if not chunks:
+                        raise DeadlineExceeded(
+                            f"{name}: no reply within {min(first_timeout, total_timeout):.1f}s") from None
+                    print(f"{name}: cut off after {total_timeout:.1f}s")
+                    return chunks, False
+                if kind == "end":
+                    self._count(name, "ok", time.perf_counter() - start)
+                    breaker.success()
+                    return chunks, True
+                if kind == "error":
+                    self._count(name, "failures")
+                    breaker.failure()
+                    if not chunks:
+                        raise value
+                    print(f"{name}: stream interrupted: {value}")
+                    return chunks, False
+                chunks.append(value)
+                if on_chunk:
+                    on_chunk(value)
+        finally:
+            stop.set()
+
+    def metrics(self):
+        """Breaker state, counters and p95 latency (ms) per backend"""
+        with self.lock:
+            names = list(self.breakers)
+        metrics = {}
+        for name in names:
+            with self.lock:
+                counters = dict(self.counters[name])
+                latencies = sorted(counters.pop("latencies"))
+            counters["state"] = self.breakers[name].state
+            if latencies:
+                counters["p95_ms"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000
+            metrics[name] = counters
+        return metrics
+
+    def summary(self):
+        """One line per backend for the UI"""
+        lines = []
+        for name, m in sorted(self.metrics().items()):
+            line = (f"{self.STATE_ICONS[m['state']]} {name}: {m['ok']}/{m['calls']} ok, "
+                    f"{m['timeouts']} timeouts, {m['rejected']} rejected")
+            if "p95_ms" in m:
+                line += f", p95 {m['p95_ms']:.0f} ms"
+            lines.append(line)
+        return "\n".join(lines)
+
+EXTERNAL = ExternalCalls()
+
+def split_speech(text, limit=TTS_CHUNK_CHARS):
+    """Split text into sentence-aligned chunks of roughly `limit` characters"""
+    chunks = []
+    current = ""
+    for piece in re.split(r"(?<=[.!?;:,])\s+", text.strip()):
+        while len(piece) > limit:
+            cut = piece.rfind(" ", 0, limit)
+            cut = cut if cut > 0 else limit
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(piece[:cut])
+            piece = piece[cut:].strip()
+        if current and len(current) + len(piece) + 1 > limit:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}".strip()
+    if current:
+        chunks.append(current)
+    return chunks
+
 class VoiceEngine:
     """Enhanced Voice Engine with gTTS and sounddevice"""
     def __init__(self):
         self.is_speaking = False
         self.speech_queue = queue.Queue()
+        self.audio_cache = {}  # canned phrase -> (samples, sample rate)
         self.start_speech_worker()
-        self.temp_audio_file = None
 
     def start_speech_worker(self):
         """Background thread for speech synthesis"""
         def worker():
             while True:
                 try:
-                    text = self.speech_queue.get(timeout=0.1)
+                    text, deadline = self.speech_queue.get(timeout=0.1)
                     if text:
-                        self._speak(text)
+                        self._speak(text, deadline)
                     self.speech_queue.task_done()
                 except queue.Empty:
                     continue
@@ -67,51 +500,668 @@ class VoiceEngine:
 
         threading.Thread(target=worker, daemon=True).start()
 
-    def _speak(self, text):
-        """Synchronous speech synthesis using gTTS and sounddevice"""
-        self.is_speaking = True
+    def _synthesize(self, text):
+        """Render text to audio samples with gTTS"""
+        tts = gtts.gTTS(text=text, lang='en', slow=False)
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as fp:
+            temp_audio_file = fp.name
         try:
-            tts = gTTS(text=text, lang='en', slow=False)
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as fp:
-                self.temp_audio_file = fp.name
-                tts.save(self.temp_audio_file)
+            tts.save(temp_audio_file)
+            return sf.read(temp_audio_file, dtype='float32')
+        finally:
+            try:
+                os.remove(temp_audio_file)
+            except OSError as e:
+                print(f"Error removing temporary file: {e}")
+
+    def _audio_for(self, chunk, timeout):
+        """Audio for one chunk: cached canned phrase, or gTTS with a timeout"""
+        if chunk in self.audio_cache:
+            return self.audio_cache[chunk]
+        return EXTERNAL.call("tts", self._synthesize, chunk, timeout=timeout)
+
+    def prefetch(self, texts):
+        """Synthesize canned phrases ahead of time so they play offline"""
+        for text in texts:
+            try:
+                self.audio_cache[text] = EXTERNAL.call("tts", self._synthesize, text, timeout=TTS_TIMEOUT)
+            except Exception as e:
+                print(f"Speech prefetch error: {e}")
+                return
 
-            # Load the audio file and play it
-            data, fs = sf.read(self.temp_audio_file, dtype='float32')
-            sd.play(data, fs)
-            sd.wait()  # Wait for the sound to finish playing
+    def max_duration(self, text):
+        """Generous upper bound on how long speaking text can take"""
+        return len(split_speech(text)) * TTS_TIMEOUT + len(text) / SPEECH_CHARS_PER_SECOND
 
+    def _speak(self, text, deadline=None):
+        """Synthesize and play text chunk by chunk
+
+        The first chunk's synthesis counts against the command deadline;
+        each following chunk is synthesized while the previous one plays.
+        """
+        self.is_speaking = True
+        try:
+            chunks = [text] if text in self.audio_cache else split_speech(text)
+            timeout = deadline.timeout(TTS_TIMEOUT) if deadline else TTS_TIMEOUT
+            audio = self._audio_for(chunks[0], timeout)
+            for i in range(len(chunks)):
+                sd.play(*audio)
+                error = None
+                if i + 1 < len(chunks):
+                    try:
+                        audio = self._audio_for(chunks[i + 1], TTS_TIMEOUT)
+                    except (DeadlineExceeded, CircuitOpenError) as e:
+                        error = e
+                sd.wait()  # Wait for the chunk to finish playing
+                if error:
+                    print(f"Speech cut short: {error}")
+                    break
+
+        except (DeadlineExceeded, CircuitOpenError) as e:
+            print(f"Speech skipped: {e}")
         except Exception as e:
             print(f"Speech error: {e}")
         finally:
-            if self.temp_audio_file:
-                try:
-                    os.remove(self.temp_audio_file)
-                    self.temp_audio_file = None
-                except OSError as e:
-                    print(f"Error removing temporary file: {e}")
             self.is_speaking = False
 
-    def speak(self, text):
+    def speak(self, text, deadline=None):
         """Queue text for speech (non-blocking)"""
         if text and not self.is_speaking:
-            self.speech_queue.put(text)
+            # Mark as speaking right away so callers waiting on it don't race the worker
+            self.is_speaking = True
+            self.speech_queue.put((text, deadline))
 
     def stop(self):
         """Stop all speech"""
         sd.stop()
 
+class SystemSampler:
+    """Samples CPU, RAM, disk and network into preallocated ring buffers"""
+    FIELDS = ("cpu", "ram", "disk", "net_down", "net_up")
+
+    def __init__(self, interval=SAMPLE_INTERVAL, capacity=SAMPLE_HISTORY):
+        self.interval = interval
+        self.capacity = capacity
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.data = np.zeros((len(self.FIELDS), capacity), dtype=np.float32)
+        self.index = 0  # next slot to write
+        self.count = 0
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.disk_path = os.path.abspath(os.sep)
+
+        # First cpu_percent() call only establishes a baseline
+        psutil.cpu_percent(interval=None)
+        self._last_net = psutil.net_io_counters()
+        self._last_time = time.monotonic()
+
+    def start(self):
+        """Start background sampling"""
+        threading.Thread(target=self._loop, name="system-sampler", daemon=True).start()
+
+    def stop(self):
+        """Stop background sampling"""
+        self.stop_event.set()
+
+    def _loop(self):
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"Sampler error: {e}")
+
+    def sample(self):
+        """Take one sample and write it into the ring buffers"""
+        now = time.monotonic()
+        cpu = psutil.cpu_percent(interval=None)
+        ram = psutil.virtual_memory().percent
+        disk = psutil.disk_usage(self.disk_path).percent
+
+        net = psutil.net_io_counters()
+        elapsed = max(now - self._last_time, 1e-6)
+        if net and self._last_net:
+            down = (net.bytes_recv - self._last_net.bytes_recv) / elapsed
+            up = (net.bytes_sent - self._last_net.bytes_sent) / elapsed
+        else:
+            down = up = 0.0
+        self._last_net = net
+        self._last_time = now
+
+        with self.lock:
+            i = self.index
+            self.times[i] = now
+            self.data[:, i] = (cpu, ram, disk, down, up)
+            self.index = (i + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    def _ordered(self, seconds=None):
+        """Return (times, data) in chronological order, optionally windowed"""
+        with self.lock:
+            order = (self.index - self.count + np.arange(self.count)) % self.capacity
+            times = self.times[order]
+            data = self.data[:, order]
+        if seconds is not None and len(times):
+            mask = times >= times[-1] - seconds
+            times, data = times[mask], data[:, mask]
+        return times, data
+
+    def latest(self):
+        """Most recent sample as a dict, or None before the first sample"""
+        with self.lock:
+            if not self.count:
+                return None
+            row = self.data[:, (self.index - 1) % self.capacity]
+            return dict(zip(self.FIELDS, row.tolist()))
+
+    def stats(self, seconds=60):
+        """Average and peak of each field over the last `seconds`"""
+        _, data = self._ordered(seconds)
+        if not data.shape[1]:
+            return None
+        return {
+            field: (float(data[i].mean()), float(data[i].max()))
+            for i, field in enumerate(self.FIELDS)
+        }
+
+    def series(self, field, seconds=None):
+        """Chronological values of one field, for plotting"""
+        _, data = self._ordered(seconds)
+        return data[self.FIELDS.index(field)]
+
+    def summary(self, seconds=60):
+        """Spoken summary of current values plus windowed averages and peaks"""
+        current = self.latest()
+        stats = self.stats(seconds)
+        if current is None:
+            return None
+        cpu_avg, cpu_peak = stats["cpu"]
+        ram_avg, ram_peak = stats["ram"]
+        # Each sample stands for one interval, so n samples cover n intervals
+        times, _ = self._ordered(seconds)
+        covered = min(seconds, round(times[-1] - times[0] + self.interval))
+        if covered >= 60:
+            minutes = round(covered / 60)
+            window = f"{minutes} minute{'s' if minutes != 1 else ''}"
+        else:
+            window = f"{covered} second{'s' if covered != 1 else ''}"
+        return (
+            f"System Status - CPU: {current['cpu']:.0f}%, RAM: {current['ram']:.0f}%, "
+            f"Disk: {current['disk']:.0f}%. "
+            f"Over the last {window}, CPU averaged {cpu_avg:.0f}% with a peak of {cpu_peak:.0f}%, "
+            f"RAM averaged {ram_avg:.0f}% with a peak of {ram_peak:.0f}%. "
+            f"Network: {current['net_down'] / 1024:.0f} KB/s down, "
+            f"{current['net_up'] / 1024:.0f} KB/s up."
+        )
+
+def wait_until(predicate, timeout, poll=0.05):
+    """Poll predicate until it returns truthy or timeout expires"""
+    deadline = time.monotonic() + timeout
+    while True:
+        if predicate():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll)
+
+class DesktopBackend:
+    """Real desktop automation: processes, windows, clipboard and browser"""
+    APPS = {
+        "chrome": ["start", "chrome"],
+        "notepad": ["notepad.exe"],
+        "calculator": ["calc.exe"],
+        "file explorer": ["explorer.exe"]
+    }
+
+    def launch(self, app_name):
+        """Start an application by its friendly name"""
+        subprocess.Popen(self.APPS[app_name])
+
+    def window_ids(self, title):
+        """Handles of open windows whose title contains `title` (None if unsupported)"""
+        get_windows = getattr(pyautogui, "getWindowsWithTitle", None)
+        if get_windows is None:
+            return None
+        return {w._hWnd for w in get_windows(title)}
+
+    def wait_for_new_window(self, title, known, timeout=WINDOW_READY_TIMEOUT):
+        """Wait for a `title` window not in `known` and bring it to the front
+
+        `known` comes from window_ids() before the launch, so an already
+        open window of the same application is never the paste target.
+        """
+        if known is None:
+            # No window query on this platform; settle for a fixed delay
+            time.sleep(WINDOW_FALLBACK_DELAY)
+            return True
+
+        found = []
+
+        def appeared():
+            found[:] = [w for w in pyautogui.getWindowsWithTitle(title) if w._hWnd not in known]
+            return bool(found)
+
+        if not wait_until(appeared, timeout):
+            return False
+        window = found[0]
+        try:
+            window.activate()
+        except Exception as e:
+            print(f"Window activate error: {e}")
+        return wait_until(lambda: getattr(pyautogui.getActiveWindow(), "_hWnd", None) == window._hWnd,
+                          timeout)
+
+    def paste(self, text):
+        """Insert text in one shot through the clipboard, then restore it"""
+        previous = pyperclip.paste()
+        pyperclip.copy(text)
+        try:
+            pyautogui.hotkey("ctrl", "v")
+        except Exception:
+            # Nothing was pasted: put the clipboard back and let the caller type
+            self._restore_clipboard(previous)
+            raise
+        # Give the target app time to read the clipboard before restoring
+        time.sleep(CLIPBOARD_RESTORE_DELAY)
+        self._restore_clipboard(previous)
+
+    def _restore_clipboard(self, previous):
+        """Best-effort restore; a failure here must not trigger a retype"""
+        try:
+            pyperclip.copy(previous)
+        except Exception as e:
+            print(f"Clipboard restore failed: {e}")
+
+    def type(self, text):
+        """Type text key by key (slow fallback)"""
+        pyautogui.write(text, interval=TYPE_INTERVAL)
+
+    def play_youtube(self, query):
+        """Play the first YouTube result for query"""
+        pywhatkit.playonyt(query)
+
+    def open_url(self, url):
+        webbrowser.open(url)
+
+class ActionExecutor:
+    """Bounded worker pool for desktop actions with completion tracking"""
+    def __init__(self, backend=None, workers=ACTION_WORKERS, limit=ACTION_QUEUE_LIMIT, on_done=None):
+        self.backend = backend or DesktopBackend()
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="action")
+        self.slots = threading.BoundedSemaphore(limit)
+        self.on_done = on_done
+        self.lock = threading.Lock()
+        self.history = deque(maxlen=100)
+        self.counts = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+
+    def submit(self, name, func, *args):
+        """Queue an action; returns its record, or None if the queue is full"""
+        if not self.slots.acquire(blocking=False):
+            with self.lock:
+                self.counts["rejected"] += 1
+            return None
+
+        record = {"name": name, "status": "queued", "submitted": time.perf_counter(),
+                  "latency": None, "error": None}
+        with self.lock:
+            self.counts["submitted"] += 1
+            self.history.append(record)
+        self.pool.submit(self._run, record, func, args)
+        return record
+
+    def _run(self, record, func, args):
+        record["status"] = "running"
+        try:
+            func(*args)
+            record["status"] = "done"
+        except Exception as e:
+            record["status"] = "failed"
+            record["error"] = str(e)
+        finally:
+            record["latency"] = time.perf_counter() - record["submitted"]
+            with self.lock:
+                self.counts["completed" if record["status"] == "done" else "failed"] += 1
+            self.slots.release()
+
+        if self.on_done:
+            try:
+                self.on_done(record)
+            except Exception as e:
+                print(f"Action callback error: {e}")
+
+    def stats(self):
+        """Counts plus average and p95 latency (ms) of finished actions"""
+        with self.lock:
+            stats = dict(self.counts)
+            latencies = sorted(r["latency"] for r in self.history if r["latency"] is not None)
+        stats["pending"] = stats["submitted"] - stats["completed"] - stats["failed"]
+        if latencies:
+            stats["avg_ms"] = sum(latencies) / len(latencies) * 1000
+            stats["p95_ms"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000
+        return stats
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    # --- Actions ---
+
+    def open_application(self, app_name):
+        return self.submit(f"open {app_name}", self.backend.launch, app_name)
+
+    def play_youtube(self, query):
+        return self.submit(f"youtube {query}", self._play_youtube, query)
+
+    def write_notepad(self, text):
+        return self.submit("write notepad", self._write_notepad, text)
+
+    def _play_youtube(self, query):
+        try:
+            EXTERNAL.call("youtube", self.backend.play_youtube, query, timeout=YOUTUBE_TIMEOUT)
+        except DeadlineExceeded as e:
+            # The abandoned call may still open the video; a search tab
+            # on top of it would give the user two tabs
+            print(f"YouTube playback slow, not opening a fallback tab: {e}")
+        except Exception as e:
+            print(f"YouTube playback error, falling back to search: {e}")
+            url = f"https://www.youtube.com/results?search_query={query.replace(' ', '+')}"
+            self.backend.open_url(url)
+
+    def _write_notepad(self, text):
+        known = self.backend.window_ids("Notepad")
+        self.backend.launch("notepad")
+        if not self.backend.wait_for_new_window("Notepad", known):
+            raise TimeoutError("Notepad window did not appear")
+        try:
+            self.backend.paste(text)
+        except Exception as e:
+            print(f"Clipboard paste failed, typing instead: {e}")
+            self.backend.type(text)
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token)"""
+    return len(text) // 4 + 1
+
+class ConversationMemory:
+    """Recent conversation turns kept under a token budget
+
+    Old turns are evicted in blocks (down to CONTEXT_LOW_WATER of the
+    budget) and folded into a short topic summary. Between evictions the
+    message prefix is unchanged turn to turn, so the backend can reuse
+    its prompt cache.
+    """
+    def __init__(self, system_prompt=SYSTEM_PROMPT, budget=CONTEXT_TOKEN_BUDGET,
+                 low_water=CONTEXT_LOW_WATER, summary_budget=SUMMARY_TOKEN_BUDGET):
+        self.system_prompt = system_prompt
+        self.budget = budget
+        self.low_water = low_water
+        self.summary_budget = summary_budget
+        self.lock = threading.Lock()
+        self.turns = deque()  # (user, assistant, tokens)
+        self.tokens = 0
+        self.topics = deque()
+        self.metrics = deque(maxlen=500)  # recent turns, for averages
+        self.total_turns = 0
+        self.evictions = 0
+
+    def messages(self, text, facts=None):
+        """Build the chat messages for a new user utterance
+
+        facts (retrieved long-term memories) go right before the utterance,
+        after the cacheable prefix.
+        """
+        with self.lock:
+            messages = [{"role": "system", "content": self.system_prompt}]
+            if self.topics:
+                messages.append({
+                    "role": "system",
+                    "content": "Earlier in this conversation: " + "; ".join(self.topics)
+                })
+            for user, assistant, _ in self.turns:
+                messages.append({"role": "user", "content": user})
+                messages.append({"role": "assistant", "content": assistant})
+        if facts:
+            messages.append({
+                "role": "system",
+                "content": "Known facts about the user: " + "; ".join(facts)
+            })
+        messages.append({"role": "user", "content": text})
+        return messages
+
+    def add_turn(self, user, assistant):
+        """Remember a completed exchange, evicting old turns if over budget"""
+        tokens = estimate_tokens(user) + estimate_tokens(assistant)
+        with self.lock:
+            self.turns.append((user, assistant, tokens))
+            self.tokens += tokens
+            if self.tokens > self.budget:
+                self.evictions += 1
+                target = self.budget * self.low_water
+                while self.turns and self.tokens > target:
+                    old_user, _, old_tokens = self.turns.popleft()
+                    self.tokens -= old_tokens
+                    self._summarize(old_user)
+
+    def _summarize(self, user):
+        """Fold an evicted turn into the topic summary (caller holds lock)"""
+        topic = re.split(r"(?<=[.?!])\s", user.strip(), maxsplit=1)[0][:80]
+        self.topics.append(topic)
+        while len(self.topics) > 1 and estimate_tokens("; ".join(self.topics)) > self.summary_budget:
+            self.topics.popleft()
+
+    def clear(self):
+        """Forget the whole conversation"""
+        with self.lock:
+            self.turns.clear()
+            self.topics.clear()
+            self.tokens = 0
+
+    def record(self, prompt_tokens, latency, evaluated_tokens=None):
+        """Record prompt size and latency of one AI turn
+
+        evaluated_tokens is the backend's count of prompt tokens it had to
+        process; well below prompt_tokens means the prefix cache was hit.
+        """
+        with self.lock:
+            self.metrics.append((prompt_tokens, latency, evaluated_tokens))
+            self.total_turns += 1
+
+    def stats(self):
+        """Per-session prompt size and latency figures"""
+        with self.lock:
+            metrics = list(self.metrics)
+            stats = {"turns": len(self.turns), "history_tokens": self.tokens,
+                     "evictions": self.evictions, "total_turns": self.total_turns,
+                     "recorded": len(metrics)}
+        if metrics:
+            sizes = [m[0] for m in metrics]
+            latencies = [m[1] for m in metrics]
+            evaluated = [m[2] for m in metrics if m[2] is not None]
+            stats["last_prompt_tokens"] = sizes[-1]
+            stats["avg_prompt_tokens"] = sum(sizes) / len(sizes)
+            stats["max_prompt_tokens"] = max(sizes)
+            stats["avg_latency_ms"] = sum(latencies) / len(latencies) * 1000
+            stats["max_latency_ms"] = max(latencies) * 1000
+            stats["last_latency_ms"] = latencies[-1] * 1000
+            if evaluated:
+                stats["avg_evaluated_tokens"] = sum(evaluated) / len(evaluated)
+        return stats
+
+    def describe(self):
+        """One-line session summary for the activity log"""
+        stats = self.stats()
+        if not stats["recorded"]:
+            return "Session: no AI turns yet"
+        window = "" if stats["recorded"] == stats["total_turns"] else f" (last {stats['recorded']})"
+        line = (f"Session: {stats['total_turns']} turns{window}, prompt avg ~{stats['avg_prompt_tokens']:.0f} "
+                f"/ max ~{stats['max_prompt_tokens']} tokens, latency avg "
+                f"{stats['avg_latency_ms'] / 1000:.2f} s / max {stats['max_latency_ms'] / 1000:.2f} s, "
+                f"{stats['evictions']} evictions")
+        if "avg_evaluated_tokens" in stats:
+            line += f", avg {stats['avg_evaluated_tokens']:.0f} tokens evaluated"
+        return line
+
+class LongTermMemory:
+    """Persistent user facts in SQLite with full-text retrieval"""
+    def __init__(self, path=MEMORY_DB_PATH):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS memories ("
+            "id INTEGER PRIMARY KEY, text TEXT UNIQUE NOT NULL, "
+            "created REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        try:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5("
+                "text, content='memories', content_rowid='id')"
+            )
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS memories_vocab USING fts5vocab(memories_fts, 'row')"
+            )
+            self.conn.executescript(
+                "CREATE TRIGGER IF NOT EXISTS memories_ai AFTER INSERT ON memories BEGIN "
+                "INSERT INTO memories_fts(rowid, text) VALUES (new.id, new.text); END;"
+                "CREATE TRIGGER IF NOT EXISTS memories_ad AFTER DELETE ON memories BEGIN "
+                "INSERT INTO memories_fts(memories_fts, rowid, text) VALUES ('delete', old.id, old.text); END;"
+            )
+            self.fts = True
+        except sqlite3.OperationalError as e:
+            print(f"FTS5 unavailable, using LIKE search: {e}")
+            self.fts = False
+        self.conn.commit()
+
+        # Document frequency per term, used to keep full-text queries on
+        # selective terms so they stay fast on large stores
+        self.doc_freq = {}
+        if self.fts:
+            self._load_doc_freq()
+
+    def _load_doc_freq(self):
+        self.doc_freq = dict(self.conn.execute("SELECT term, doc FROM memories_vocab"))
+
+    # --- Store / retrieve ---
+
+    def add(self, text):
+        """Store a memory (repeats refresh its timestamp); returns its id"""
+        text = text.strip()
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute("SELECT id FROM memories WHERE text = ?", (text,)).fetchone()
+            if row:
+                row_id = row[0]
+                self.conn.execute("UPDATE memories SET updated = ? WHERE id = ?", (now, row_id))
+            else:
+                row_id = self.conn.execute(
+                    "INSERT INTO memories (text, created, updated) VALUES (?, ?, ?)",
+                    (text, now, now)
+                ).lastrowid
+                for word in set(re.findall(r"\w+", text.lower())):
+                    self.doc_freq[word] = self.doc_freq.get(word, 0) + 1
+            self.conn.commit()
+        return row_id
+
+    def forget(self, text):
+        """Delete memories matching every keyword of text; returns their texts"""
+        words = self.keywords(text)
+        if not words:
+            return []
+        with self.lock:
+            if self.fts:
+                rows = self.conn.execute(
+                    "SELECT rowid, text FROM memories_fts WHERE memories_fts MATCH ?",
+                    (" AND ".join(f'"{w}"' for w in words),)
+                ).fetchall()
+            else:
+                clause = " AND ".join("text LIKE ?" for _ in words)
+                rows = self.conn.execute(
+                    f"SELECT id, text FROM memories WHERE {clause}", [f"%{w}%" for w in words]
+                ).fetchall()
+            if not rows:
+                return []
+
+            ids = [row_id for row_id, _ in rows]
+            self.conn.executemany("DELETE FROM memories WHERE id = ?", [(i,) for i in ids])
+            self.conn.commit()
+            for _, deleted in rows:
+                for word in set(re.findall(r"\w+", deleted.lower())):
+                    if self.doc_freq.get(word):
+                        self.doc_freq[word] -= 1
+        return [deleted for _, deleted in rows]
+
+    @staticmethod
+    def keywords(text):
+        """Search terms from free text, without stopwords and short tokens"""
+        return [w for w in re.findall(r"\w+", text.lower()) if len(w) > 2 and w not in STOPWORDS]
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+
+    def _search_text(self, words, k):
+        if self.fts:
+            terms = sorted({w for w in words if self.doc_freq.get(w)}, key=self.doc_freq.get)
+            if not terms:
+                return []
+            selective = [t for t in terms if self.doc_freq[t] <= MEMORY_MAX_TERM_DF][:4]
+            if selective:
+                query = " OR ".join(f'"{t}"' for t in selective)
+                order = "bm25(memories_fts)"
+            else:
+                # Only very common terms: ranking them all would scan a large
+                # share of the table, so take the newest matches instead
+                query = f'"{terms[0]}"'
+                order = "rowid DESC"
+            rows = self.conn.execute(
+                f"SELECT rowid FROM memories_fts WHERE memories_fts MATCH ? ORDER BY {order} LIMIT ?",
+                (query, k)
+            ).fetchall()
+        else:
+            clause = " OR ".join("text LIKE ?" for _ in words)
+            rows = self.conn.execute(
+                f"SELECT id FROM memories WHERE {clause} ORDER BY updated DESC LIMIT ?",
+                [f"%{w}%" for w in words] + [k]
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def search(self, text, k=MEMORY_TOP_K):
+        """Top-k memories sharing a keyword with text (none for unrelated text)"""
+        words = self.keywords(text)
+        if not words:
+            return []
+        with self.lock:
+            best = self._search_text(words, k)
+            if not best:
+                return []
+            texts = dict(self.conn.execute(
+                f"SELECT id, text FROM memories WHERE id IN ({','.join('?' * len(best))})", best
+            ).fetchall())
+        return [texts[row_id] for row_id in best if row_id in texts]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
 class CommandProcessor:
     """Handles all command processing with queue system"""
+    BUSY_REPLY = "I'm still working through earlier actions. Please try again in a moment."
+
     def __init__(self, ui_ref):
         self.ui = ui_ref
         self.command_queue = queue.Queue()
         self.processing = False
         self.current_command = None
         self.model = "qwen2.5:7b"
+        self.actions = ActionExecutor(on_done=self._on_action_done)
+        self.memory = ConversationMemory()
+        self.long_term = None  # LongTermMemory, opened in the background
+        self.ai_clients = {}  # host -> ollama.Client
         
-        # Command patterns
+        # Command patterns. First match wins: the anchored memory commands go before the broad
+        # patterns, which would otherwise match words inside the remembered fact
         self.command_patterns = {
+            "forget": r"^(forget|clear|reset) (the |this |our )?(conversation|context|chat)",
+            "forget_fact": r"^forget (that |about )?.+",
+            "remember": r"^remember (that )?.+",
             "greeting": r"(hi|hello|hey).*jarvis",
             "time": r"(what.*time|current.*time|time.*now)",
             "date": r"(what.*date|today.*date|current.*date)",
@@ -119,7 +1169,7 @@ class CommandProcessor:
             "youtube": r"play.*(youtube|song).*",
             "search": r"search.*google.*",
             "write": r"write.*notepad.*",
-            "system": r"(cpu|ram|memory|system).*usage",
+            "system": r"(cpu|ram|memory|system).*(usage|status)",
             "shutdown": r"(shutdown|turn off).*computer",
             "weather": r"weather.*in.*"
         }
@@ -145,19 +1195,20 @@ class CommandProcessor:
                 self.ui.update_reactor_state("BUSY")
                 self.ui.log_event(f"Processing command from {source}: {command_text}")
                 
-                # Process command
-                response = self._process_command(command_text)
+                # Process command within its time budget
+                deadline = Deadline(COMMAND_DEADLINE)
+                response = self._process_command(command_text, deadline)
                 
-                # Update UI with response
-                self.ui.update_response(response)
+                # Update UI with response (queued behind any partial AI reply redraws)
+                self.ui.after(0, lambda: self.ui.update_response(response))
                 self.ui.log_event(f"Response: {response[:50]}...")
                 
                 # Speak response
-                self.ui.voice.speak(response)
+                self.ui.voice.speak(response, deadline)
                 
                 # Wait for speech to complete
-                while self.ui.voice.is_speaking:
-                    time.sleep(0.1)
+                wait_until(lambda: not self.ui.voice.is_speaking,
+                           deadline.remaining() + self.ui.voice.max_duration(response), poll=0.1)
                 
                 # Reset state
                 self.current_command = None
@@ -175,20 +1226,20 @@ class CommandProcessor:
                 print(f"Queue processing error: {e}")
                 self.processing = False
     
-    def _process_command(self, text):
+    def _process_command(self, text, deadline=None):
         """Process individual command"""
         text_lower = text.lower()
         
         # System commands (fast response)
         for cmd_type, pattern in self.command_patterns.items():
             if re.search(pattern, text_lower):
-                return self._execute_system_command(cmd_type, text_lower)
+                return self._execute_system_command(cmd_type, text_lower, text)
         
         # AI commands
-        return self._execute_ai_command(text)
+        return self._execute_ai_command(text, deadline or Deadline(COMMAND_DEADLINE))
     
-    def _execute_system_command(self, cmd_type, text):
-        """Execute system-level commands"""
+    def _execute_system_command(self, cmd_type, text, original=None):
+        """Execute system-level commands (text is lowercased, original keeps case)"""
         if cmd_type == "greeting":
             return "Hello, I'm here. How can I assist you?"
         
@@ -204,24 +1255,32 @@ class CommandProcessor:
             app_match = re.search(r"open.*(chrome|notepad|calculator|file explorer)", text)
             if app_match:
                 app = app_match.group(1)
-                self._open_application(app)
+                if not self.actions.open_application(app):
+                    return self.BUSY_REPLY
                 return f"Opening {app}"
         
         elif cmd_type == "youtube":
             query = re.sub(r"play.*(youtube|song)\s*", "", text).strip()
             if query:
-                threading.Thread(target=self._play_youtube, args=(query,), daemon=True).start()
+                if not self.actions.play_youtube(query):
+                    return self.BUSY_REPLY
                 return f"Playing {query} on YouTube"
         
         elif cmd_type == "write":
             content_match = re.search(r"write.*notepad.*", text)
             if content_match:
                 content = text.replace("write", "").replace("notepad", "").strip()
-                threading.Thread(target=self._write_notepad, args=(content,), daemon=True).start()
+                if not self.actions.write_notepad(content):
+                    return self.BUSY_REPLY
                 return f"Writing to Notepad: {content[:30]}..."
         
         elif cmd_type == "system":
-            cpu = psutil.cpu_percent()
+            sampler = self.ui.sampler
+            summary = sampler.summary() if sampler else None
+            if summary:
+                return summary
+            # Sampler not up yet: take a short blocking reading instead
+            cpu = psutil.cpu_percent(interval=0.1)
             ram = psutil.virtual_memory().percent
             return f"System Status - CPU: {cpu}%, RAM: {ram}%"
         
@@ -232,48 +1291,123 @@ class CommandProcessor:
             location = text.replace("weather in", "").replace("weather", "").strip()
             return f"Checking weather for {location}..."
         
+        elif cmd_type == "forget":
+            self.memory.clear()
+            return "Conversation context cleared."
+        
+        elif cmd_type == "forget_fact":
+            if not self.long_term:
+                return "My long-term memory is still starting up."
+            target = re.sub(r"^forget (that |about )?", "", (original or text).strip(), flags=re.I)
+            forgotten = self.long_term.forget(target)
+            if not forgotten:
+                return f"I don't have anything stored about {target}."
+            return f"Forgotten: {'; '.join(forgotten)}."
+        
+        elif cmd_type == "remember":
+            if not self.long_term:
+                return "My long-term memory is still starting up."
+            fact = re.sub(r"^remember (that )?", "", (original or text).strip(), flags=re.I)
+            self.long_term.add(fact)
+            return f"Noted. I'll remember that {fact}."
+        
         return None
     
-    def _execute_ai_command(self, text):
-        """Execute command using Ollama AI"""
+    def _client(self, host=None):
+        """Ollama client per host; its read timeout aborts stalled streams"""
+        if host not in self.ai_clients:
+            self.ai_clients[host] = ollama.Client(host=host, timeout=AI_STALL_TIMEOUT)
+        return self.ai_clients[host]
+    
+    def _chat_stream(self, client, model, messages):
+        """Streaming chat: an iterator of reply chunks"""
+        return client.chat(model=model, messages=messages, stream=True, keep_alive=OLLAMA_KEEP_ALIVE)
+    
+    def _execute_ai_command(self, text, deadline):
+        """Execute command using Ollama AI, streaming the reply
+
+        The reply is shown as it arrives. The first token and the whole
+        reply each have a limit, capped by the command deadline with time
+        left to start speaking; a reply cut off by the limit is kept.
+        """
         try:
-            response = ollama.chat(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are JARVIS. Be concise and helpful."},
-                    {"role": "user", "content": text}
-                ]
+            facts = []
+            if self.long_term:
+                start = time.perf_counter()
+                facts = self.long_term.search(text)
+                fact = extract_fact(text)
+                if fact:
+                    self.long_term.add(fact)
+                self.ui.log_event(f"Memory: {len(facts)} facts in {(time.perf_counter() - start) * 1000:.1f} ms")
+            
+            messages = self.memory.messages(text, facts)
+            prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+            
+            attempts = [("ollama", self._client(), self.model)]
+            if AI_FALLBACK_MODEL:
+                attempts.append(("ollama_fallback", self._client(AI_FALLBACK_HOST), AI_FALLBACK_MODEL))
+            
+            parts = []
+            marks = {"first": None, "shown": 0.0}
+            
+            def show(chunk):
+                parts.append(chunk['message']['content'])
+                now = time.perf_counter()
+                if marks["first"] is None:
+                    marks["first"] = now
+                if now - marks["shown"] >= STREAM_DISPLAY_INTERVAL:
+                    marks["shown"] = now
+                    partial = "".join(parts)
+                    self.ui.after(0, lambda: self.ui.update_response(partial))
+            
+            start = time.perf_counter()
+            for i, (name, client, model) in enumerate(attempts):
+                try:
+                    chunks, complete = EXTERNAL.stream(
+                        name, self._chat_stream, client, model, messages,
+                        first_timeout=deadline.timeout(AI_FIRST_TOKEN_TIMEOUT, reserve=TTS_TIMEOUT),
+                        total_timeout=deadline.timeout(AI_TOTAL_TIMEOUT, reserve=TTS_TIMEOUT),
+                        on_chunk=show)
+                    break
+                except Exception as e:
+                    if i + 1 == len(attempts):
+                        raise
+                    print(f"AI backend {name} failed, trying {attempts[i + 1][0]}: {e}")
+            latency = time.perf_counter() - start
+            first_token = marks["first"] - start if marks["first"] else latency
+            final = chunks[-1] if chunks else {}
+            
+            reply = "".join(parts)
+            evaluated = final.get('prompt_eval_count')
+            self.memory.add_turn(text, reply)
+            self.memory.record(prompt_tokens, latency, evaluated)
+            self.ui.log_event(
+                f"AI turn: ~{prompt_tokens} prompt tokens"
+                f"{f' ({evaluated} evaluated)' if evaluated is not None else ''}, "
+                f"first token {first_token:.2f} s, total {latency:.2f} s"
+                f"{'' if complete else ' (cut off)'}"
             )
-            return response['message']['content']
+            if self.memory.total_turns % 10 == 0:
+                self.ui.log_event(self.memory.describe())
+            return reply
+        except CircuitOpenError as e:
+            print(f"AI unavailable: {e}")
+            return AI_OFFLINE_REPLY
+        except DeadlineExceeded as e:
+            print(f"AI timeout: {e}")
+            return AI_TIMEOUT_REPLY
         except Exception as e:
             print(f"AI error: {e}")
-            return "I'm having trouble accessing my neural network."
-    
-    def _open_application(self, app_name):
-        """Open system applications"""
-        apps = {
-            "chrome": ["start", "chrome"],
-            "notepad": ["notepad.exe"],
-            "calculator": ["calc.exe"],
-            "file explorer": ["explorer.exe"]
-        }
-        
-        if app_name in apps:
-            subprocess.Popen(apps[app_name])
-    
-    def _play_youtube(self, query):
-        """Play video on YouTube"""
-        try:
-            pywhatkit.playonyt(query)
-        except:
-            url = f"https://www.youtube.com/results?search_query={query.replace(' ', '+')}"
-            webbrowser.open(url)
+            return AI_UNAVAILABLE_REPLY
     
-    def _write_notepad(self, text):
-        """Write text to Notepad"""
-        subprocess.Popen("notepad.exe")
-        time.sleep(0.8)
-        pyautogui.write(text, interval=0.02)
+    def _on_action_done(self, record):
+        """Report a finished desktop action in the activity log"""
+        latency_ms = record["latency"] * 1000
+        if record["status"] == "done":
+            msg = f"Action done: {record['name']} ({latency_ms:.0f} ms)"
+        else:
+            msg = f"Action failed: {record['name']} - {record['error']}"
+        self.ui.after(0, lambda: self.ui.log_event(msg))
 
 class VoiceListener:
     """Handles voice input with proper state management"""
@@ -287,6 +1421,7 @@ class VoiceListener:
         self.recognizer.energy_threshold = 300
         self.recognizer.dynamic_energy_threshold = True
         self.recognizer.pause_threshold = 0.5
+        self.recognizer.operation_timeout = RECOGNIZER_TIMEOUT
         
         # Calibrate for noise
         with self.microphone as source:
@@ -310,6 +1445,12 @@ class VoiceListener:
                 time.sleep(0.1)
                 continue
             
+            # Recognizer backend is failing: don't record audio we can't transcribe
+            if not EXTERNAL.breaker("speech_recognition").available():
+                self.processor.ui.update_status("🎤 RECOGNIZER OFFLINE", "#666666")
+                time.sleep(1)
+                continue
+            
             try:
                 with self.microphone as source:
                     # Quick ambient adjustment
@@ -327,7 +1468,12 @@ class VoiceListener:
                     )
                     
                     # Convert to text
-                    text = self.recognizer.recognize_google(audio)
+                    text = EXTERNAL.call(
+                        "speech_recognition",
+                        self.recognizer.recognize_google, audio,
+                        timeout=RECOGNIZER_TIMEOUT + 1,
+                        expected=(sr.UnknownValueError,)
+                    )
                     
                     if text and len(text.strip()) > 1:
                         print(f"🎤 Recognized: {text}")
@@ -345,6 +1491,8 @@ class VoiceListener:
                 continue
             except sr.RequestError as e:
                 print(f"Speech recognition error: {e}")
+            except (DeadlineExceeded, CircuitOpenError) as e:
+                print(f"Speech recognition unavailable: {e}")
             except Exception as e:
                 print(f"Listening error: {e}")
             
@@ -432,6 +1580,63 @@ class ReactorDisplay(ctk.CTkCanvas):
         
         self.after(30, self.animate)
 
+class SparklinePanel(ctk.CTkCanvas):
+    """Sparklines for CPU, RAM and network, drawn from the sampler buffers"""
+    ROWS = (
+        ("CPU", ("cpu",), THEME_COLOR),
+        ("RAM", ("ram",), SECONDARY_COLOR),
+        ("NET", ("net_down", "net_up"), ACCENT_COLOR),
+    )
+
+    def __init__(self, master, width=360, height=96, seconds=120):
+        super().__init__(master, width=width, height=height, bg="#0a0a1a", highlightthickness=0)
+        self.width = width
+        self.height = height
+        self.seconds = seconds
+        self.sampler = None
+
+        self.refresh()
+
+    def set_sampler(self, sampler):
+        """Attach the sampler once it is running"""
+        self.sampler = sampler
+
+    def refresh(self):
+        """Redraw loop"""
+        self.delete("all")
+        row_height = self.height / len(self.ROWS)
+        label_width = 90
+        plot_width = self.width - label_width - 10
+
+        for row, (label, fields, color) in enumerate(self.ROWS):
+            top = row * row_height + 4
+            bottom = (row + 1) * row_height - 4
+            text = f"{label}: --"
+
+            if self.sampler and self.sampler.count:
+                series = [self.sampler.series(f, self.seconds) for f in fields]
+                if label == "NET":
+                    values = series[0] + series[1]
+                    scale = max(float(values.max()), 1.0)
+                    text = f"{label}: {values[-1] / 1024:.0f}K/s"
+                else:
+                    values = series[0]
+                    scale = 100.0
+                    text = f"{label}: {values[-1]:.0f}%"
+
+                if len(values) > 1:
+                    step = plot_width / (len(values) - 1)
+                    points = []
+                    for i, value in enumerate(values.tolist()):
+                        points.append(label_width + i * step)
+                        points.append(bottom - (bottom - top) * min(value / scale, 1.0))
+                    self.create_line(*points, fill=color, width=1.5)
+
+            self.create_text(6, (top + bottom) / 2, text=text, anchor="w",
+                             fill=color, font=("Consolas", 10))
+
+        self.after(int(SAMPLE_INTERVAL * 1000), self.refresh)
+
 class JarvisInterface(ctk.CTk):
     """Main JARVIS interface with dual input support"""
     def __init__(self):
@@ -443,23 +1648,26 @@ class JarvisInterface(ctk.CTk):
         self.configure(fg_color=BG_COLOR)
         ctk.set_appearance_mode("dark")
         
-        # Initialize systems
-        self.voice = VoiceEngine()
-        self.processor = CommandProcessor(self)
-        self.listener = VoiceListener(self.processor)
+        # Initialize lightweight systems; the microphone and heavy modules
+        # come up in the background (see init_subsystems)
+        with STARTUP_PROFILER.phase("init", "VoiceEngine + CommandProcessor"):
+            self.voice = VoiceEngine()
+            self.processor = CommandProcessor(self)
+        self.listener = None
+        self.sampler = None
         
         # State variables
         self.is_running = True
         self.voice_enabled = True
+        self.subsystems = {"Voice In": "⏳", "Voice Out": "⏳", "AI Core": "⏳", "Memory": "⏳"}
         
         # Setup GUI
-        self.setup_interface()
+        with STARTUP_PROFILER.phase("init", "setup_interface"):
+            self.setup_interface()
+        self.after(0, lambda: STARTUP_PROFILER.mark("window shown"))
         
         # Start systems
         self.start_systems()
-        
-        # Initial greeting
-        self.after(1000, lambda: self.voice.speak("Systems online. Voice and text input active."))
     
     def setup_interface(self):
         """Setup the user interface"""
@@ -502,6 +1710,15 @@ class JarvisInterface(ctk.CTk):
         )
         self.status_label.pack(pady=(20, 10))
         
+        # Subsystem readiness
+        self.subsystem_label = ctk.CTkLabel(
+            self.left_frame,
+            text=self._subsystem_text(),
+            font=("Consolas", 12),
+            text_color="#8888ff"
+        )
+        self.subsystem_label.pack(pady=(0, 5))
+        
         # Response Display
         response_frame = ctk.CTkFrame(self.left_frame, fg_color="#111122", corner_radius=10)
         response_frame.pack(fill="both", expand=True, pady=20, padx=20)
@@ -647,6 +1864,36 @@ class JarvisInterface(ctk.CTk):
         quick_frame.grid_columnconfigure(0, weight=1)
         quick_frame.grid_columnconfigure(1, weight=1)
         
+        # Desktop action counters and latency
+        self.action_label = ctk.CTkLabel(
+            self.right_frame,
+            text="Actions: none yet",
+            font=("Consolas", 10),
+            text_color="#8888ff"
+        )
+        self.action_label.pack(padx=20, pady=(0, 5))
+        
+        # System Monitor
+        monitor_title = ctk.CTkLabel(
+            self.right_frame,
+            text="SYSTEM MONITOR",
+            font=("Arial", 16, "bold"),
+            text_color=SECONDARY_COLOR
+        )
+        monitor_title.pack(pady=(10, 5))
+        
+        self.sparklines = SparklinePanel(self.right_frame)
+        self.sparklines.pack(padx=20, pady=(0, 5))
+        
+        self.backend_label = ctk.CTkLabel(
+            self.right_frame,
+            text="Backends: no calls yet",
+            font=("Consolas", 10),
+            text_color="#8888ff",
+            justify="left"
+        )
+        self.backend_label.pack(padx=20, pady=(0, 10))
+        
         # Activity Log
         log_title = ctk.CTkLabel(
             self.right_frame,
@@ -670,17 +1917,111 @@ class JarvisInterface(ctk.CTk):
     
     def start_systems(self):
         """Start all background systems"""
-        # Start voice listening
-        self.listener.start_listening()
+        # Surface circuit breaker changes and backend metrics
+        EXTERNAL.on_change = lambda name, state: self.after(
+            0, lambda: self.log_event(f"Backend {name}: circuit {state.upper()}"))
+        self.refresh_backends()
+        self.refresh_actions()
         
-        # Start system monitoring
-        threading.Thread(target=self.monitor_system, daemon=True).start()
+        # Bring up heavy subsystems without blocking the window
+        threading.Thread(target=self.init_subsystems, name="subsystem-init", daemon=True).start()
         
         # Log startup
         self.log_event("System initialized")
-        self.log_event("Voice input: ACTIVE")
         self.log_event("Text input: READY")
     
+    def init_subsystems(self):
+        """Load heavy modules and open the microphone in the background"""
+        try:
+            with STARTUP_PROFILER.phase("init", "SystemSampler"):
+                self.sampler = SystemSampler()
+                self.sampler.start()
+            self.after(0, lambda: self.sparklines.set_sampler(self.sampler))
+        except Exception as e:
+            print(f"Sampler init error: {e}")
+        
+        try:
+            with STARTUP_PROFILER.phase("init", "voice output modules"):
+                gtts.load()
+                sd.load()
+                sf.load()
+            voice_out = True
+            self.after(0, lambda: self.set_subsystem_ready("Voice Out"))
+            self.after(0, lambda: self.voice.speak("Systems online. Voice and text input active."))
+        except Exception as e:
+            print(f"Voice output init error: {e}")
+            voice_out = False
+            self.after(0, lambda: self.set_subsystem_ready("Voice Out", False))
+        
+        try:
+            with STARTUP_PROFILER.phase("init", "ollama client"):
+                ollama.load()
+            self.after(0, lambda: self.set_subsystem_ready("AI Core"))
+        except Exception as e:
+            print(f"AI init error: {e}")
+            self.after(0, lambda: self.set_subsystem_ready("AI Core", False))
+        
+        try:
+            with STARTUP_PROFILER.phase("init", "VoiceListener (mic + calibration)"):
+                self.listener = VoiceListener(self.processor)
+            if self.voice_enabled:
+                self.listener.start_listening()
+            self.after(0, lambda: self.set_subsystem_ready("Voice In"))
+        except Exception as e:
+            print(f"Voice input init error: {e}")
+            self.after(0, lambda: self.set_subsystem_ready("Voice In", False))
+        
+        try:
+            with STARTUP_PROFILER.phase("init", "LongTermMemory"):
+                self.processor.long_term = LongTermMemory()
+            self.after(0, lambda: self.set_subsystem_ready("Memory"))
+        except Exception as e:
+            print(f"Memory init error: {e}")
+            self.after(0, lambda: self.set_subsystem_ready("Memory", False))
+        
+        STARTUP_PROFILER.mark("subsystems ready")
+        self.after(0, self.report_startup)
+        
+        # Cache audio for the fallback replies so they play even when TTS is down
+        if voice_out:
+            self.voice.prefetch([AI_UNAVAILABLE_REPLY, AI_TIMEOUT_REPLY, AI_OFFLINE_REPLY])
+    
+    def refresh_actions(self):
+        """Redraw desktop action counters and latency"""
+        stats = self.processor.actions.stats()
+        if stats["submitted"] or stats["rejected"]:
+            text = (f"Actions: {stats['completed']} done, {stats['failed']} failed, "
+                    f"{stats['pending']} pending, {stats['rejected']} rejected")
+            if "p95_ms" in stats:
+                text += f" | p95 {stats['p95_ms']:.0f} ms"
+            self.action_label.configure(text=text)
+        self.after(2000, self.refresh_actions)
+    
+    def refresh_backends(self):
+        """Redraw backend breaker states and counters"""
+        summary = EXTERNAL.summary()
+        if summary:
+            self.backend_label.configure(text=summary)
+        self.after(2000, self.refresh_backends)
+    
+    def _subsystem_text(self):
+        return " | ".join(f"{name}: {state}" for name, state in self.subsystems.items())
+    
+    def set_subsystem_ready(self, name, ok=True):
+        """Mark a background subsystem as ready (or failed) in the UI"""
+        self.subsystems[name] = "✅" if ok else "❌"
+        self.subsystem_label.configure(text=self._subsystem_text())
+        self.log_event(f"{name}: {'READY' if ok else 'UNAVAILABLE'}")
+    
+    def report_startup(self):
+        """Log the startup summary; print the full profile with --profile-startup"""
+        milestones = STARTUP_PROFILER.milestones
+        window_ms = milestones.get("window shown", 0) * 1000
+        ready_ms = milestones.get("subsystems ready", 0) * 1000
+        self.log_event(f"Startup: window {window_ms:.0f} ms, subsystems {ready_ms:.0f} ms")
+        if "--profile-startup" in sys.argv:
+            print(STARTUP_PROFILER.report())
+    
     def update_status(self, text, color):
         """Update status display"""
         self.status_label.configure(text=text, text_color=color)
@@ -718,12 +2059,14 @@ class JarvisInterface(ctk.CTk):
         """Toggle voice input on/off"""
         if self.voice_toggle.get():
             self.voice_enabled = True
-            self.listener.listening = True
+            if self.listener:
+                self.listener.listening = True
             self.voice_status.configure(text="🎤 Voice: ACTIVE", text_color=SECONDARY_COLOR)
             self.log_event("Voice input: ENABLED")
         else:
             self.voice_enabled = False
-            self.listener.listening = False
+            if self.listener:
+                self.listener.listening = False
             self.voice_status.configure(text="🎤 Voice: INACTIVE", text_color="#666666")
             self.log_event("Voice input: DISABLED")
     
@@ -758,34 +2101,22 @@ class JarvisInterface(ctk.CTk):
         self.input_text.insert("1.0", command)
         self.send_text_command()
     
-    def monitor_system(self):
-        """Monitor system resources"""
-        while self.is_running:
-            try:
-                cpu = psutil.cpu_percent()
-                ram = psutil.virtual_memory().percent
-                
-                # Update status with system info periodically
-                if random.random() < 0.1:  # 10% chance to update
-                    status_msg = f"✅ READY | CPU: {cpu}% | RAM: {ram}%"
-                    self.status_label.configure(text=status_msg)
-                    
-            except Exception as e:
-                print(f"Monitor error: {e}")
-            
-            time.sleep(5)
-    
     def on_closing(self):
         """Clean shutdown"""
         self.is_running = False
-        self.listener.stop_listening()
-        self.voice.stop()
+        if self.listener:
+            self.listener.stop_listening()
+        if self.sampler:
+            self.sampler.stop()
+        self.processor.actions.shutdown()
+        if self.processor.long_term:
+            self.processor.long_term.close()
+        if sd.loaded:
+            self.voice.stop()
         self.destroy()
 
-# For random system updates
-import random
-
 if __name__ == "__main__":
+    
     print("""
     ╔══════════════════════════════════════════════════════════╗
     ║        J.A.R.V.I.S. MARK 110 - DUAL INPUT EDITION        ║
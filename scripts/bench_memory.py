@@ -0,0 +1,59 @@
+"""Print LongTermMemory retrieval latency at a few store sizes.
+
+Usage: python scripts/bench_memory.py [size ...]   (default: 10000 1000000)
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+VOCAB = [f"{a}{b}" for a in ("pro", "na", "ka", "mi", "ter", "lo", "vi", "sha")
+         for b in ("ject", "me", "ra", "nox", "dex", "lin", "ber", "tum", "gon", "sa")]
+TEMPLATES = ["my name is {}", "i am working on {} and {}", "i prefer {} over {}",
+             "my favourite {} is {}", "remind me that {} needs {}"]
+
+
+def sentence(rng):
+    template = rng.choice(TEMPLATES)
+    return template.format(*(rng.choice(VOCAB) + str(rng.randrange(1000)) for _ in range(2)))
+
+
+def bench(size, queries=200):
+    rng = random.Random(size)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = app.LongTermMemory(os.path.join(tmp, "bench.db"))
+        start = time.perf_counter()
+        now = time.time()
+        texts = set()
+        while len(texts) < size:
+            texts.add(sentence(rng))
+        with store.lock:
+            store.conn.executemany(
+                "INSERT INTO memories (text, created, updated) VALUES (?, ?, ?)",
+                ((t, now, now) for t in texts)
+            )
+            store.conn.commit()
+        if store.fts:
+            store._load_doc_freq()
+        print(f"{store.count():,} memories loaded in {time.perf_counter() - start:.1f} s")
+
+        latencies = []
+        for _ in range(queries):
+            query = sentence(rng)
+            start = time.perf_counter()
+            store.search(query)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        print(f"  search()  p50 {latencies[len(latencies) // 2] * 1000:7.2f} ms"
+              f"  p95 {latencies[int(len(latencies) * 0.95)] * 1000:7.2f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    for size in [int(arg) for arg in sys.argv[1:]] or [10_000, 1_000_000]:
+        bench(size)
@@ -0,0 +1,167 @@
+"""ActionExecutor and DesktopBackend against stubbed automation backends"""
+import time
+import types
+
+import pytest
+
+import app
+
+
+class StubBackend:
+    """Records calls instead of driving the desktop"""
+    def __init__(self, launch_delay=0.0, paste_works=True):
+        self.launch_delay = launch_delay
+        self.paste_works = paste_works
+        self.calls = []
+
+    def launch(self, app_name):
+        self.calls.append(("launch", app_name))
+        time.sleep(self.launch_delay)
+
+    def window_ids(self, title):
+        return set()
+
+    def wait_for_new_window(self, title, known, timeout=app.WINDOW_READY_TIMEOUT):
+        return True
+
+    def paste(self, text):
+        if not self.paste_works:
+            raise RuntimeError("no clipboard")
+        self.calls.append(("paste", text))
+
+    def type(self, text):
+        self.calls.append(("type", text))
+
+    def play_youtube(self, query):
+        self.calls.append(("youtube", query))
+
+    def open_url(self, url):
+        self.calls.append(("url", url))
+
+
+TEXT = "The quick brown fox jumps over the lazy dog. " * 20
+
+
+def finish(records, timeout=5):
+    assert app.wait_until(lambda: all(r["status"] in ("done", "failed") for r in records), timeout)
+
+
+@pytest.fixture
+def executor_for():
+    executors = []
+
+    def make(backend, **kwargs):
+        executor = app.ActionExecutor(backend=backend, **kwargs)
+        executors.append(executor)
+        return executor
+
+    yield make
+    for executor in executors:
+        executor.shutdown()
+
+
+def test_actions_complete_and_report_latency(executor_for):
+    backend = StubBackend(launch_delay=0.05)
+    executor = executor_for(backend)
+    records = [executor.write_notepad(TEXT), executor.open_application("calculator"),
+               executor.play_youtube("lofi beats")]
+    finish(records)
+
+    assert [r["status"] for r in records] == ["done", "done", "done"]
+    stats = executor.stats()
+    assert stats["completed"] == 3 and stats["failed"] == 0 and stats["pending"] == 0
+    # Launch plus a single paste: bounded by the stub's launch time, not the text length
+    assert stats["p95_ms"] < 500
+    assert records[0]["latency"] < 0.5
+
+
+def test_text_is_inserted_with_one_paste(executor_for):
+    backend = StubBackend()
+    finish([executor_for(backend).write_notepad(TEXT)])
+    assert backend.calls == [("launch", "notepad"), ("paste", TEXT)]
+
+
+def test_failed_paste_falls_back_to_typing(executor_for):
+    backend = StubBackend(paste_works=False)
+    record = executor_for(backend).write_notepad(TEXT)
+    finish([record])
+    assert record["status"] == "done"
+    assert ("type", TEXT) in backend.calls
+
+
+def test_missing_window_fails_the_action(executor_for):
+    backend = StubBackend()
+    backend.wait_for_new_window = lambda title, known, timeout=None: False
+    record = executor_for(backend).write_notepad(TEXT)
+    finish([record])
+    assert record["status"] == "failed"
+    assert not any(call[0] in ("paste", "type") for call in backend.calls)
+
+
+def test_submissions_beyond_limit_are_rejected(executor_for):
+    executor = executor_for(StubBackend(launch_delay=0.3), workers=1, limit=2)
+    accepted = [executor.open_application("notepad") for _ in range(4)]
+    assert accepted[0] and accepted[1]
+    assert accepted[2] is None and accepted[3] is None
+    assert executor.stats()["rejected"] == 2
+    finish(accepted[:2])
+    # Slots free up once actions finish
+    assert executor.open_application("notepad") is not None
+
+
+class StubClipboard:
+    def __init__(self, content="user data", fail_restore=False):
+        self.content = content
+        self.fail_restore = fail_restore
+        self.copies = 0
+
+    def paste(self):
+        return self.content
+
+    def copy(self, text):
+        self.copies += 1
+        if self.fail_restore and self.copies > 1:
+            raise RuntimeError("clipboard locked")
+        self.content = text
+
+
+def test_paste_restores_clipboard(monkeypatch):
+    clipboard = StubClipboard()
+    keys = []
+    monkeypatch.setattr(app, "pyperclip", clipboard)
+    monkeypatch.setattr(app, "pyautogui", types.SimpleNamespace(hotkey=lambda *k: keys.append(k)))
+    monkeypatch.setattr(app, "CLIPBOARD_RESTORE_DELAY", 0)
+
+    app.DesktopBackend().paste("hello")
+    assert keys == [("ctrl", "v")]
+    assert clipboard.content == "user data"
+
+
+def test_failed_restore_does_not_retype(monkeypatch):
+    clipboard = StubClipboard(fail_restore=True)
+    monkeypatch.setattr(app, "pyperclip", clipboard)
+    monkeypatch.setattr(app, "pyautogui", types.SimpleNamespace(hotkey=lambda *k: None))
+    monkeypatch.setattr(app, "CLIPBOARD_RESTORE_DELAY", 0)
+
+    backend = app.DesktopBackend()
+    typed = []
+    backend.launch = lambda name: None
+    backend.window_ids = lambda title: set()
+    backend.wait_for_new_window = lambda title, known, timeout=None: True
+    backend.type = typed.append
+
+    app.ActionExecutor(backend=backend)._write_notepad("hello")
+    assert typed == []
+
+
+def test_failed_hotkey_restores_clipboard_and_raises(monkeypatch):
+    clipboard = StubClipboard()
+
+    def hotkey(*keys):
+        raise OSError("no display")
+
+    monkeypatch.setattr(app, "pyperclip", clipboard)
+    monkeypatch.setattr(app, "pyautogui", types.SimpleNamespace(hotkey=hotkey))
+    with pytest.raises(OSError):
+        app.DesktopBackend().paste("hello")
+    assert clipboard.content == "user data"
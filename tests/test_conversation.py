@@ -0,0 +1,85 @@
+"""ConversationMemory over long sessions"""
+import random
+import time
+
+import app
+
+
+class PrefixCacheChat:
+    """Stand-in chat backend that reports how much of each prompt it had to
+    evaluate: messages matching the previous prompt plus its reply are
+    treated as cached, like Ollama's KV cache."""
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.cached = []
+
+    def __call__(self, messages):
+        shared = 0
+        while (shared < min(len(self.cached), len(messages))
+               and self.cached[shared] == messages[shared]):
+            shared += 1
+        evaluated = sum(app.estimate_tokens(m["content"]) for m in messages[shared:])
+        reply = " ".join(self.rng.choice(("sure", "the", "reactor", "output", "is", "stable"))
+                         for _ in range(self.rng.randrange(10, 80)))
+        self.cached = messages + [{"role": "assistant", "content": reply}]
+        return {"message": {"content": reply}, "prompt_eval_count": evaluated}
+
+
+def run_session(memory, turns, seed=0):
+    rng = random.Random(seed)
+    chat = PrefixCacheChat(seed)
+    per_turn = []
+    for turn in range(turns):
+        text = f"Follow-up {turn}: " + " ".join(
+            rng.choice(("what", "about", "the", "suit", "power", "levels"))
+            for _ in range(rng.randrange(4, 20)))
+        start = time.perf_counter()
+        messages = memory.messages(text)
+        prompt_tokens = sum(app.estimate_tokens(m["content"]) for m in messages)
+        response = chat(messages)
+        memory.add_turn(text, response["message"]["content"])
+        elapsed = time.perf_counter() - start
+        memory.record(prompt_tokens, elapsed, response["prompt_eval_count"])
+        per_turn.append((prompt_tokens, response["prompt_eval_count"], elapsed))
+    return per_turn
+
+
+def test_prompt_size_stays_bounded_over_long_session():
+    memory = app.ConversationMemory()
+    per_turn = run_session(memory, 2000)
+
+    limit = app.CONTEXT_TOKEN_BUDGET + app.SUMMARY_TOKEN_BUDGET + 200
+    assert max(p for p, _, _ in per_turn) <= limit
+    # Late turns are no bigger than early ones once the budget is reached
+    assert max(p for p, _, _ in per_turn[-500:]) <= limit
+    assert memory.evictions > 0
+
+
+def test_prompt_cache_reused_between_evictions():
+    memory = app.ConversationMemory()
+    per_turn = run_session(memory, 1000)
+
+    reused = sum(1 for prompt, evaluated, _ in per_turn if evaluated < prompt / 2)
+    # Only turns right after an eviction miss the cache
+    assert reused >= len(per_turn) - memory.evictions - 1
+
+
+def test_memory_overhead_per_turn_stays_flat():
+    memory = app.ConversationMemory()
+    per_turn = run_session(memory, 2000)
+
+    early = sorted(t for _, _, t in per_turn[100:600])
+    late = sorted(t for _, _, t in per_turn[-500:])
+    # Measured cost of building the prompt and recording the turn does not
+    # grow with session length (generous bound to tolerate noisy machines)
+    assert late[len(late) // 2] < early[len(early) // 2] * 3 + 0.001
+
+
+def test_stats_count_all_turns_beyond_metrics_window():
+    memory = app.ConversationMemory()
+    run_session(memory, 620)
+
+    stats = memory.stats()
+    assert stats["total_turns"] == 620
+    assert stats["recorded"] == 500
+    assert memory.describe().startswith("Session: 620 turns (last 500)")
@@ -0,0 +1,72 @@
+"""LongTermMemory storage and the memory commands"""
+import pytest
+
+import app
+
+
+class StubUI:
+    def __init__(self):
+        self.events = []
+
+    def log_event(self, message):
+        self.events.append(message)
+
+    def after(self, delay, func, *args):
+        pass
+
+
+@pytest.fixture
+def store(tmp_path):
+    memory = app.LongTermMemory(str(tmp_path / "memory.db"))
+    yield memory
+    memory.close()
+
+
+@pytest.fixture
+def processor(store):
+    processor = app.CommandProcessor(StubUI())
+    processor.long_term = store
+    return processor
+
+
+def test_search_finds_related_facts_only(store):
+    store.add("I am working on the Mark 42 suit")
+    store.add("my favourite drink is espresso")
+    assert store.search("which suit am I working on") == ["I am working on the Mark 42 suit"]
+    assert store.search("how tall is mount everest") == []
+
+
+def test_add_twice_keeps_one_row(store):
+    store.add("my name is Tony")
+    store.add("my name is Tony")
+    assert store.count() == 1
+
+
+def test_forget_removes_matching_facts(store):
+    store.add("my car is red")
+    store.add("my house is blue")
+    assert store.forget("car") == ["my car is red"]
+    assert store.search("what colour is my car") == []
+    assert store.count() == 1
+
+
+@pytest.mark.parametrize("text", [
+    "remember that I open chrome every morning",
+    "remember that this is my project, jarvis",
+    "remember my system status report goes to Pepper",
+])
+def test_remember_wins_over_broad_patterns(processor, store, text):
+    assert processor._process_command(text).startswith("Noted.")
+    assert store.count() == 1
+
+
+def test_forget_fact_wins_over_broad_patterns(processor, store):
+    store.add("I open chrome every morning")
+    assert processor._process_command("forget that I open chrome every morning").startswith("Forgotten:")
+    assert store.count() == 0
+
+
+def test_forget_conversation_still_clears_context(processor, store):
+    processor.memory.add_turn("hello", "hi there")
+    assert processor._process_command("forget the conversation") == "Conversation context cleared."
+    assert processor.memory.stats()["turns"] == 0
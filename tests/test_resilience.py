@@ -0,0 +1,247 @@
+"""ExternalCalls timeouts, breakers and streams, and the fallbacks built on them"""
+import time
+
+import pytest
+
+import app
+
+
+def chunk(text):
+    return {"message": {"content": text}}
+
+
+def slow_stream(first_delay=0.0, interval=0.05, count=None):
+    """Chunks every `interval` seconds after `first_delay`; endless by default"""
+    time.sleep(first_delay)
+    i = 0
+    while count is None or i < count:
+        yield chunk(f"word{i} ")
+        i += 1
+        time.sleep(interval)
+
+
+def fail():
+    raise ConnectionError("injected failure")
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = app.ExternalCalls(failures=2, reset_after=0.2)
+    monkeypatch.setattr(app, "EXTERNAL", calls)
+    return calls
+
+
+def test_hung_call_times_out(calls):
+    start = time.perf_counter()
+    with pytest.raises(app.DeadlineExceeded):
+        calls.call("hang", time.sleep, 5, timeout=0.2)
+    assert time.perf_counter() - start < 1.0
+    assert calls.metrics()["hang"]["timeouts"] == 1
+
+
+def test_breaker_opens_and_rejects_without_calling(calls):
+    attempts = []
+
+    def counted():
+        attempts.append(1)
+        fail()
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            calls.call("fail", counted, timeout=1.0)
+    with pytest.raises(app.CircuitOpenError):
+        calls.call("fail", counted, timeout=1.0)
+    m = calls.metrics()["fail"]
+    assert (len(attempts), m["failures"], m["rejected"], m["state"]) == (2, 2, 1, "open")
+
+
+def test_breaker_closes_after_successful_probe(calls):
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            calls.call("backend", fail, timeout=1.0)
+    time.sleep(0.25)
+    assert calls.call("backend", lambda: "back", timeout=1.0) == "back"
+    assert calls.metrics()["backend"]["state"] == "closed"
+
+
+def test_failed_probe_reopens_breaker(calls):
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            calls.call("backend", fail, timeout=1.0)
+    time.sleep(0.25)
+    with pytest.raises(ConnectionError):
+        calls.call("backend", fail, timeout=1.0)
+    with pytest.raises(app.CircuitOpenError):
+        calls.call("backend", lambda: "back", timeout=1.0)
+    assert calls.metrics()["backend"]["state"] == "open"
+
+
+def test_half_open_breaker_lets_one_probe_through():
+    breaker = app.CircuitBreaker("backend", failures=1, reset_after=0.05)
+    breaker.failure()
+    assert not breaker.allow()
+    time.sleep(0.1)
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+    breaker.success()
+    assert breaker.allow() and breaker.state == "closed"
+
+
+def test_complete_stream_records_total_latency(calls):
+    chunks, complete = calls.stream("ai", slow_stream, 0.0, 0.05, 4,
+                                    first_timeout=1.0, total_timeout=2.0)
+    m = calls.metrics()["ai"]
+    assert complete and len(chunks) == 4
+    assert (m["ok"], m["timeouts"]) == (1, 0)
+    assert m["p95_ms"] >= 150
+
+
+def test_long_stream_is_cut_off_and_counted_as_timeout(calls):
+    seen = []
+    start = time.perf_counter()
+    chunks, complete = calls.stream("ai", slow_stream, first_timeout=1.0, total_timeout=0.4,
+                                    on_chunk=seen.append)
+    elapsed = time.perf_counter() - start
+    m = calls.metrics()["ai"]
+    assert not complete and chunks and seen == chunks
+    assert elapsed < 0.8
+    assert (m["ok"], m["timeouts"]) == (0, 1)
+    assert m["p95_ms"] >= 400
+
+
+def test_stream_without_first_token_times_out(calls):
+    with pytest.raises(app.DeadlineExceeded):
+        calls.stream("ai", slow_stream, 5.0, first_timeout=0.2, total_timeout=2.0)
+    assert calls.metrics()["ai"]["timeouts"] == 1
+
+
+class StubClient:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def chat(self, model, messages, stream, keep_alive):
+        return self.stream()
+
+
+class StubUI:
+    def __init__(self):
+        self.events = []
+        self.responses = []
+
+    def log_event(self, message):
+        self.events.append(message)
+
+    def update_response(self, text):
+        self.responses.append(text)
+
+    def after(self, delay, func, *args):
+        func(*args)
+
+
+def ask(client):
+    processor = app.CommandProcessor(StubUI())
+    processor.ai_clients[None] = client
+    reply = processor._execute_ai_command("tell me about the suit", app.Deadline(app.COMMAND_DEADLINE))
+    return processor, reply
+
+
+def test_ai_reply_is_shown_while_streaming(calls):
+    processor, reply = ask(StubClient(lambda: slow_stream(interval=0.12, count=3)))
+    assert reply == "word0 word1 word2 "
+    assert len(processor.ui.responses) >= 2
+    assert all(reply.startswith(partial) for partial in processor.ui.responses)
+
+
+def test_ai_reply_cut_off_at_total_limit(calls, monkeypatch):
+    monkeypatch.setattr(app, "AI_TOTAL_TIMEOUT", 0.3)
+    processor, reply = ask(StubClient(slow_stream))
+    assert reply.startswith("word0 ")
+    assert calls.metrics()["ollama"]["timeouts"] == 1
+    assert "(cut off)" in processor.ui.events[-1]
+
+
+def test_ai_error_gives_unavailable_reply(calls):
+    _, reply = ask(StubClient(fail))
+    assert reply == app.AI_UNAVAILABLE_REPLY
+
+
+def test_ai_timeout_gives_timeout_reply(calls, monkeypatch):
+    monkeypatch.setattr(app, "AI_FIRST_TOKEN_TIMEOUT", 0.2)
+    _, reply = ask(StubClient(lambda: slow_stream(first_delay=5.0)))
+    assert reply == app.AI_TIMEOUT_REPLY
+
+
+def test_ai_open_breaker_gives_offline_reply(calls):
+    for _ in range(2):
+        calls.breaker("ollama").failure()
+    _, reply = ask(StubClient(lambda: slow_stream(count=1)))
+    assert reply == app.AI_OFFLINE_REPLY
+
+
+def test_ai_falls_back_to_second_backend(calls, monkeypatch):
+    monkeypatch.setattr(app, "AI_FALLBACK_MODEL", "small")
+    monkeypatch.setattr(app, "AI_FALLBACK_HOST", "http://backup:11434")
+    processor = app.CommandProcessor(StubUI())
+    processor.ai_clients[None] = StubClient(fail)
+    processor.ai_clients["http://backup:11434"] = StubClient(lambda: slow_stream(count=2))
+    reply = processor._execute_ai_command("hello", app.Deadline(app.COMMAND_DEADLINE))
+    assert reply == "word0 word1 "
+    assert calls.metrics()["ollama"]["failures"] == 1
+
+
+class StubSound:
+    def __init__(self):
+        self.played = []
+
+    def play(self, samples, rate):
+        self.played.append((samples, rate))
+
+    def wait(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+def test_cached_reply_plays_when_tts_is_down(calls, monkeypatch):
+    sound = StubSound()
+    monkeypatch.setattr(app, "sd", sound)
+    engine = app.VoiceEngine()
+    monkeypatch.setattr(engine, "_synthesize", lambda text: ("samples", 24000))
+    engine.prefetch([app.AI_OFFLINE_REPLY])
+    monkeypatch.setattr(engine, "_synthesize", lambda text: fail())
+
+    engine._speak(app.AI_OFFLINE_REPLY)
+    engine._speak("An uncached reply")
+    assert sound.played == [("samples", 24000)]
+    assert not engine.is_speaking
+
+
+class StubYouTube:
+    def __init__(self, play):
+        self.play = play
+        self.urls = []
+
+    def play_youtube(self, query):
+        self.play()
+
+    def open_url(self, url):
+        self.urls.append(url)
+
+
+def test_youtube_error_opens_search(calls):
+    backend = StubYouTube(fail)
+    executor = app.ActionExecutor(backend=backend)
+    executor._play_youtube("iron man theme")
+    executor.shutdown()
+    assert backend.urls == ["https://www.youtube.com/results?search_query=iron+man+theme"]
+
+
+def test_youtube_timeout_opens_no_second_tab(calls, monkeypatch):
+    monkeypatch.setattr(app, "YOUTUBE_TIMEOUT", 0.2)
+    backend = StubYouTube(lambda: time.sleep(2))
+    executor = app.ActionExecutor(backend=backend)
+    executor._play_youtube("iron man theme")
+    executor.shutdown()
+    assert backend.urls == []